@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from activities.questions import legacy_table_available, sync_questions
+
+
+class Command(BaseCommand):
+    help = (
+        "Sync science_activity_question from the legacy question_1..question_5 "
+        "columns. Safe to re-run; run it after every migrate and after loading "
+        "or editing activities."
+    )
+
+    def handle(self, *args, **options):
+        if not legacy_table_available(connection):
+            self.stdout.write("science_activity is not available; nothing to sync.")
+            return
+
+        stats = sync_questions()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced questions for {stats['activities']} activities "
+                f"({stats['updated']} updated, {stats['removed']} removed)."
+            )
+        )
@@ -0,0 +1,82 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from activities.questions import legacy_table_available, sync_questions
+
+
+def backfill_questions(apps, schema_editor):
+    """
+    Copy the legacy question_1..question_5 columns into science_activity_question.
+
+    Uses the same idempotent sync as ``manage.py backfill_activity_questions``;
+    there is nothing to backfill where science_activity is unavailable
+    (e.g. local SQLite).
+    """
+    if not legacy_table_available(schema_editor.connection):
+        return
+
+    sync_questions(
+        activity_model=apps.get_model("activities", "ScienceActivity"),
+        question_model=apps.get_model("activities", "ScienceActivityQuestion"),
+        marker_model=apps.get_model("activities", "ScienceActivityQuestionBackfill"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("activities", "0003_alter_scienceactivity_table"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScienceActivityQuestion",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("position", models.PositiveSmallIntegerField()),
+                ("text", models.TextField()),
+                (
+                    "activity",
+                    models.ForeignKey(
+                        db_column="activity_id",
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="questions",
+                        to="activities.scienceactivity",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "science_activity_question",
+                "ordering": ["activity", "position"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("activity", "position"),
+                        name="unique_activity_question_position",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ScienceActivityQuestionBackfill",
+            fields=[
+                (
+                    "activity",
+                    models.OneToOneField(
+                        db_column="activity_id",
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="question_backfill",
+                        serialize=False,
+                        to="activities.scienceactivity",
+                    ),
+                ),
+                ("backfilled_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "science_activity_question_backfill",
+            },
+        ),
+        migrations.RunPython(backfill_questions, migrations.RunPython.noop),
+    ]
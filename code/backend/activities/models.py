@@ -15,6 +15,16 @@ class ScienceActivity(models.Model):
     question_4 = models.TextField(null=True, blank=True)
     question_5 = models.TextField(null=True, blank=True)
 
+    # Wide question columns, still the source of truth for question text.
+    # ScienceActivityQuestion is a read copy synced by backfill_activity_questions.
+    LEGACY_QUESTION_FIELDS = (
+        "question_1",
+        "question_2",
+        "question_3",
+        "question_4",
+        "question_5",
+    )
+
     class Meta:
         db_table = '"public"."science_activity"'
         managed = False
@@ -42,3 +52,55 @@ class ScienceActivityImages(models.Model):
 
     def __str__(self):
         return f"{self.activity.activity_id} - {self.file_path}"
+
+
+class ScienceActivityQuestion(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    # No DB-level FK: science_activity is unmanaged and its schema-qualified
+    # table name can't be referenced on SQLite.
+    activity = models.ForeignKey(
+        ScienceActivity,
+        on_delete=models.CASCADE,
+        db_column="activity_id",
+        db_constraint=False,
+        related_name="questions",
+    )
+    position = models.PositiveSmallIntegerField()
+    text = models.TextField()
+
+    class Meta:
+        db_table = "science_activity_question"
+        ordering = ["activity", "position"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["activity", "position"],
+                name="unique_activity_question_position",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.activity_id} - Q{self.position}"
+
+
+class ScienceActivityQuestionBackfill(models.Model):
+    """
+    Marks an activity whose questions live in science_activity_question.
+
+    Activities without a marker are read from the legacy question columns.
+    """
+
+    activity = models.OneToOneField(
+        ScienceActivity,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        db_column="activity_id",
+        db_constraint=False,
+        related_name="question_backfill",
+    )
+    backfilled_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "science_activity_question_backfill"
+
+    def __str__(self):
+        return f"{self.activity_id} - backfilled"
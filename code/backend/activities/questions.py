@@ -0,0 +1,162 @@
+"""
+Question storage for science activities.
+
+Question text is still written to the legacy question_1..question_5 columns of
+science_activity, which is loaded externally; those columns are the source of
+truth. science_activity_question is an ordered read copy that
+``manage.py backfill_activity_questions`` keeps in sync, and a
+science_activity_question_backfill marker records which activities have been
+synced. Activities without a marker are read from the legacy columns.
+"""
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from .models import (
+    ScienceActivity,
+    ScienceActivityQuestion,
+    ScienceActivityQuestionBackfill,
+)
+
+
+def _clean_legacy_questions(values):
+    return [q.strip() for q in values if q and q.strip()]
+
+
+def legacy_table_available(connection):
+    """
+    science_activity is unmanaged and schema-qualified, so it is only usable on
+    the PostgreSQL database (not on the local SQLite fallback).
+    """
+    if connection.vendor != "postgresql":
+        return False
+    return "science_activity" in connection.introspection.table_names()
+
+
+def sync_questions(
+    activity_model=ScienceActivity,
+    question_model=ScienceActivityQuestion,
+    marker_model=ScienceActivityQuestionBackfill,
+    batch_size=500,
+):
+    """
+    Copy the legacy question columns into science_activity_question.
+
+    Idempotent: activities whose questions already match are left alone,
+    changed ones are rewritten, new ones get rows and a marker, and rows for
+    activities that no longer exist are removed. The models are parameters so
+    the 0004 migration can pass its historical models.
+
+    Returns a dict with the number of activities seen, rewritten and removed.
+    """
+    stats = {"activities": 0, "updated": 0, "removed": 0}
+    seen = set()
+
+    with transaction.atomic():
+        rows = activity_model.objects.order_by("id").values_list(
+            "id", *ScienceActivity.LEGACY_QUESTION_FIELDS
+        )
+        chunk = []
+        for row in rows.iterator(chunk_size=batch_size):
+            chunk.append(row)
+            if len(chunk) == batch_size:
+                stats["updated"] += _sync_chunk(chunk, question_model, marker_model)
+                chunk = []
+            seen.add(row[0])
+        if chunk:
+            stats["updated"] += _sync_chunk(chunk, question_model, marker_model)
+        stats["activities"] = len(seen)
+
+        # science_activity has no FK constraint to cascade deletes from
+        orphans = marker_model.objects.exclude(activity_id__in=seen)
+        stats["removed"] = orphans.count()
+        orphans.delete()
+        question_model.objects.exclude(activity_id__in=seen).delete()
+
+    return stats
+
+
+def _sync_chunk(rows, question_model, marker_model):
+    expected = {}
+    for pk, *values in rows:
+        expected[pk] = [
+            (position, text.strip())
+            for position, text in enumerate(values, start=1)
+            if text and text.strip()
+        ]
+
+    existing = {pk: [] for pk in expected}
+    stored = (
+        question_model.objects.filter(activity_id__in=expected)
+        .order_by("activity_id", "position")
+        .values_list("activity_id", "position", "text")
+    )
+    for pk, position, text in stored:
+        existing[pk].append((position, text))
+
+    changed = [pk for pk, items in expected.items() if items != existing[pk]]
+    if changed:
+        question_model.objects.filter(activity_id__in=changed).delete()
+        question_model.objects.bulk_create(
+            question_model(activity_id=pk, position=position, text=text)
+            for pk in changed
+            for position, text in expected[pk]
+        )
+
+    # Activities with no questions get a marker too, so they are never re-read
+    # from the legacy columns.
+    marker_model.objects.bulk_create(
+        [marker_model(activity_id=pk) for pk in expected], ignore_conflicts=True
+    )
+    return len(changed)
+
+
+def with_question_state(queryset):
+    """
+    Annotate activities with ``questions_synced`` and ``has_questions`` so that
+    get_questions_by_activity() only queries the stores it actually needs.
+    """
+    return queryset.annotate(
+        questions_synced=Exists(
+            ScienceActivityQuestionBackfill.objects.filter(activity=OuterRef("pk"))
+        ),
+        has_questions=Exists(
+            ScienceActivityQuestion.objects.filter(activity=OuterRef("pk"))
+        ),
+    )
+
+
+def get_questions_by_activity(activities):
+    """
+    Bulk-load ordered question lists for many activities at once.
+
+    ``activities`` must come from a with_question_state() queryset. Returns a
+    dict mapping each activity primary key to its list of question strings:
+    synced activities are read from science_activity_question in one query,
+    synced activities without questions cost nothing, and activities that are
+    not synced yet fall back to the legacy question_1..question_5 columns.
+    """
+    activities = list(activities)
+    questions = {activity.pk: [] for activity in activities}
+
+    # 1. normalized table, one query for every synced activity
+    synced = [a.pk for a in activities if a.questions_synced and a.has_questions]
+    if synced:
+        rows = (
+            ScienceActivityQuestion.objects.filter(activity_id__in=synced)
+            .order_by("activity_id", "position")
+            .values_list("activity_id", "text")
+        )
+        for pk, text in rows:
+            questions[pk].append(text)
+
+    # 2. compatibility read path for activities not synced yet
+    missing = [a.pk for a in activities if not a.questions_synced]
+    if missing:
+        legacy_rows = ScienceActivity.objects.filter(id__in=missing).values_list(
+            "id", *ScienceActivity.LEGACY_QUESTION_FIELDS
+        )
+        for pk, *values in legacy_rows:
+            questions[pk] = _clean_legacy_questions(values)
+
+    return questions
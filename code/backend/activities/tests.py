@@ -0,0 +1,165 @@
+import importlib
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from .models import (
+    ScienceActivity,
+    ScienceActivityQuestion,
+    ScienceActivityQuestionBackfill,
+)
+from .questions import get_questions_by_activity, sync_questions, with_question_state
+
+migration_0004 = importlib.import_module(
+    "activities.migrations.0004_scienceactivityquestion"
+)
+
+
+class LegacyTableTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # science_activity is unmanaged and schema-qualified; create a plain
+        # copy of it for the test database.
+        cls._db_table = mock.patch.object(
+            ScienceActivity._meta, "db_table", "science_activity"
+        )
+        cls._db_table.start()
+        with connection.schema_editor() as editor:
+            editor.create_model(ScienceActivity)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            editor.delete_model(ScienceActivity)
+        cls._db_table.stop()
+
+    def stored_questions(self):
+        return list(
+            ScienceActivityQuestion.objects.order_by(
+                "activity_id", "position"
+            ).values_list("activity_id", "position", "text")
+        )
+
+    def markers(self):
+        return set(
+            ScienceActivityQuestionBackfill.objects.values_list(
+                "activity_id", flat=True
+            )
+        )
+
+
+class GetQuestionsByActivityTests(LegacyTableTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.synced = ScienceActivity.objects.create(
+            activity_id="A1", question_1="Q1", question_2="Q2"
+        )
+        cls.no_questions = ScienceActivity.objects.create(activity_id="A2")
+        sync_questions()
+        cls.legacy = ScienceActivity.objects.create(
+            activity_id="A3", question_1=" First ", question_2="  ", question_4="Fourth"
+        )
+
+    def load(self, *activities):
+        pks = [activity.pk for activity in activities]
+        return list(with_question_state(ScienceActivity.objects.filter(pk__in=pks)))
+
+    def test_loads_ordered_questions_in_bulk(self):
+        activities = self.load(self.synced, self.no_questions)
+        with self.assertNumQueries(1):
+            questions = get_questions_by_activity(activities)
+        self.assertEqual(
+            questions, {self.synced.id: ["Q1", "Q2"], self.no_questions.id: []}
+        )
+
+    def test_falls_back_to_legacy_columns_when_not_synced(self):
+        questions = get_questions_by_activity(self.load(self.legacy))
+        self.assertEqual(questions, {self.legacy.id: ["First", "Fourth"]})
+
+    def test_synced_activity_without_questions_runs_no_queries(self):
+        activities = self.load(self.no_questions)
+        with self.assertNumQueries(0):
+            questions = get_questions_by_activity(activities)
+        self.assertEqual(questions, {self.no_questions.id: []})
+
+    def test_empty_input_runs_no_queries(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(get_questions_by_activity([]), {})
+
+
+class BackfillQuestionsTests(LegacyTableTestCase):
+    def setUp(self):
+        self.first = ScienceActivity.objects.create(
+            activity_id="A1", question_1=" a ", question_2="   ", question_3="c"
+        )
+        self.empty = ScienceActivity.objects.create(activity_id="A2")
+
+    def backfill(self, vendor="postgresql"):
+        introspection = SimpleNamespace(table_names=lambda: ["science_activity"])
+        schema_editor = SimpleNamespace(
+            connection=SimpleNamespace(vendor=vendor, introspection=introspection)
+        )
+        migration_0004.backfill_questions(apps, schema_editor)
+
+    def test_copies_questions_and_marks_every_activity(self):
+        self.backfill()
+        self.assertEqual(
+            self.stored_questions(), [(self.first.id, 1, "a"), (self.first.id, 3, "c")]
+        )
+        self.assertEqual(self.markers(), {self.first.id, self.empty.id})
+
+    def test_rerun_is_idempotent(self):
+        self.backfill()
+        self.backfill()
+        self.assertEqual(len(self.stored_questions()), 2)
+        self.assertEqual(len(self.markers()), 2)
+
+    def test_skips_databases_without_legacy_table(self):
+        self.backfill(vendor="sqlite")
+        self.assertEqual(self.stored_questions(), [])
+        self.assertEqual(self.markers(), set())
+
+
+class SyncQuestionsTests(LegacyTableTestCase):
+    def setUp(self):
+        self.activity = ScienceActivity.objects.create(
+            activity_id="A1", question_1="Old", question_2="Kept"
+        )
+        sync_questions()
+
+    def test_unchanged_activities_are_left_alone(self):
+        self.assertEqual(sync_questions()["updated"], 0)
+
+    def test_resyncs_edited_legacy_columns(self):
+        ScienceActivity.objects.filter(pk=self.activity.pk).update(
+            question_1=None, question_5="New"
+        )
+        self.assertEqual(sync_questions()["updated"], 1)
+        self.assertEqual(
+            self.stored_questions(),
+            [(self.activity.id, 2, "Kept"), (self.activity.id, 5, "New")],
+        )
+
+    def test_syncs_new_and_removes_deleted_activities(self):
+        new = ScienceActivity.objects.create(activity_id="A2", question_1="Q")
+        # removed externally, like the rest of the science_activity content
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM science_activity WHERE id = %s", [self.activity.pk]
+            )
+        stats = sync_questions()
+        self.assertEqual(stats["removed"], 1)
+        self.assertEqual(self.stored_questions(), [(new.id, 1, "Q")])
+        self.assertEqual(self.markers(), {new.id})
+
+    def test_command_skips_without_legacy_table(self):
+        out = StringIO()
+        call_command("backfill_activity_questions", stdout=out)
+        self.assertIn("nothing to sync", out.getvalue())
@@ -2,6 +2,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from .models import ScienceActivity
+from .questions import get_questions_by_activity, with_question_state
 from django.db import connection
 
 
@@ -34,8 +35,10 @@ def get_science_activity(request, activity_id):
     from the science_activity_images table.
     """
     try:
-        # 1. load activity
-        activity = ScienceActivity.objects.get(activity_id=activity_id)
+        # 1. load activity (question text is loaded separately below)
+        activity = with_question_state(
+            ScienceActivity.objects.only("id", "activity_title", "activity_task")
+        ).get(activity_id=activity_id)
         base_url = request.build_absolute_uri("/").rstrip("/")
 
         # 2. search image
@@ -75,17 +78,7 @@ def get_science_activity(request, activity_id):
             )
 
         # 4. questions
-        questions = [
-            q.strip()
-            for q in [
-                activity.question_1,
-                activity.question_2,
-                activity.question_3,
-                activity.question_4,
-                activity.question_5,
-            ]
-            if q and q.strip()
-        ]
+        questions = get_questions_by_activity([activity])[activity.id]
 
         # 5. response
         data = {
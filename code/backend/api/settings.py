@@ -105,11 +105,13 @@ WSGI_APPLICATION = "api.wsgi.application"
 
 # Database (Neon PostgreSQL or fallback SQLite)
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Persistent connections must be disabled (0) when serving ASGI
+DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", "600"))
 
 if DATABASE_URL:
     DATABASES = {
         "default": dj_database_url.parse(
-            DATABASE_URL, conn_max_age=600, ssl_require=True
+            DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, ssl_require=True
         )
     }
 else:
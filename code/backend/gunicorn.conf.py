@@ -0,0 +1,122 @@
+"""
+Gunicorn config for serving the api project in production.
+
+Replaces ``manage.py runserver`` with a pool of pre-forked workers.
+Migrations are NOT run here; run ``python manage.py migrate`` once as a
+separate step before starting the server.
+
+Every setting can be overridden from the environment:
+
+    GUNICORN_SERVER               "wsgi" (sync workers, default) or "asgi"
+    GUNICORN_BIND                 address to listen on (default 0.0.0.0:8000)
+    WEB_CONCURRENCY               number of worker processes (default 2 * CPUs + 1,
+                                  counting CPU affinity and cgroup CPU limits)
+    GUNICORN_MAX_WORKERS          upper bound for the default worker count (unset:
+                                  no bound); ignored when WEB_CONCURRENCY is set
+    GUNICORN_THREADS              threads per sync worker (default 1)
+    GUNICORN_MAX_REQUESTS         recycle a worker after N requests (0 disables)
+    GUNICORN_MAX_REQUESTS_JITTER  random spread so workers don't recycle together
+    GUNICORN_TIMEOUT              seconds before a silent worker is killed
+    GUNICORN_GRACEFUL_TIMEOUT     seconds a worker gets to finish on reload/stop
+    GUNICORN_RELOAD               "true" to restart workers on code changes (dev only)
+
+Graceful reload: send SIGHUP to the master process (``kill -HUP <pid>``)
+to start fresh workers and let the old ones finish their requests.
+
+Each worker keeps its own persistent database connection, so the worker
+count is also the number of connections held against the database. Use
+GUNICORN_MAX_WORKERS (or WEB_CONCURRENCY) to stay under the database's
+connection limit on large hosts.
+"""
+
+import math
+import os
+from pathlib import Path
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _available_cpus():
+    """CPUs this process may use, honouring affinity and cgroup CPU quotas."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        # not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+    quota_files = (
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        (Path("/sys/fs/cgroup/cpu.max"), None),
+        # cgroup v1
+        (
+            Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"),
+            Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us"),
+        ),
+    )
+    for quota_file, period_file in quota_files:
+        try:
+            if period_file is None:
+                quota, period = quota_file.read_text().split()
+            else:
+                quota = quota_file.read_text().strip()
+                period = period_file.read_text().strip()
+        except (OSError, ValueError):
+            continue
+        if quota in ("max", "-1"):
+            break
+        return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+    return cpus
+
+
+SERVER = os.getenv("GUNICORN_SERVER", "wsgi").lower()
+if SERVER not in ("wsgi", "asgi"):
+    raise ValueError(f"GUNICORN_SERVER must be 'wsgi' or 'asgi', got {SERVER!r}")
+
+# Application
+if SERVER == "asgi":
+    wsgi_app = "api.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+    # Django requires persistent connections to be disabled in async mode
+    raw_env = ["DJANGO_SETTINGS_MODULE=api.settings", "DB_CONN_MAX_AGE=0"]
+else:
+    wsgi_app = "api.wsgi:application"
+    threads = _env_int("GUNICORN_THREADS", 1)
+    worker_class = "gthread" if threads > 1 else "sync"
+    raw_env = ["DJANGO_SETTINGS_MODULE=api.settings"]
+
+# Restart workers on code changes; development only, e.g. docker compose
+reload = os.getenv("GUNICORN_RELOAD", "false").lower() == "true"
+
+# Load Django once in the master so workers fork with it already imported.
+# Preloaded code is never re-imported, so this is off when reloading.
+preload_app = not reload
+
+# Server socket
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Worker pool
+workers = _env_int("WEB_CONCURRENCY", 0)
+if not workers:
+    workers = _available_cpus() * 2 + 1
+    max_workers = _env_int("GUNICORN_MAX_WORKERS", 0)
+    if max_workers:
+        workers = min(workers, max_workers)
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = 5
+
+# Logging
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    # Never share a database connection opened during preload between workers
+    from django.db import connections
+
+    connections.close_all()
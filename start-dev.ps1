@@ -10,7 +10,7 @@ $backendPath = Join-Path $repoRoot 'code\backend'
 $frontendPath = Join-Path $repoRoot 'code\frontend'
 
 Write-Host "Starting backend in a new PowerShell window..."
-Start-Process powershell -ArgumentList "-NoExit","-Command","cd '$backendPath'; if (-Not (Test-Path .venv)) { python -m venv .venv }; . .venv\Scripts\Activate.ps1; pip install -r requirements.txt; python manage.py migrate; python manage.py runserver 0.0.0.0:8000"
+Start-Process powershell -ArgumentList "-NoExit","-Command","cd '$backendPath'; if (-Not (Test-Path .venv)) { python -m venv .venv }; . .venv\Scripts\Activate.ps1; pip install -r requirements.txt; python manage.py migrate; python manage.py backfill_activity_questions; python manage.py runserver 0.0.0.0:8000"
 
 Start-Sleep -Milliseconds 800
 